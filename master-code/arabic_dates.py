@@ -0,0 +1,28 @@
+"""Parsing of the Arabic publication dates scraped from alresalah.ps."""
+
+import pandas as pd
+
+# Define a mapping for Arabic to English month conversion
+arabic_to_english_months = {
+    'يناير': 'January', 'فبراير': 'February', 'مارس': 'March',
+    'أبريل': 'April', 'مايو': 'May', 'يونيو': 'June',
+    'يوليو': 'July', 'أغسطس': 'August', 'سبتمبر': 'September',
+    'أكتوبر': 'October', 'نوفمبر': 'November', 'ديسمبر': 'December'
+}
+
+# Every character Python's re treats as \s, spelled out because pyarrow's RE2
+# engine (used by str.extract on Arrow strings) only treats ASCII whitespace as \s
+UNICODE_WHITESPACE = '\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+SPACE = f'[{UNICODE_WHITESPACE}]'
+# Named groups are required by RE2; the month is any non-space run since RE2's \w is ASCII-only
+ARABIC_DATE_PATTERN = (f'(?P<month>[^{UNICODE_WHITESPACE}]+){SPACE}+(?P<year>\\d{{4}}){SPACE}\\.{SPACE}'
+                       f'الساعة:{SPACE}(?P<time>\\d{{2}}:\\d{{2}}){SPACE}(?P<am_pm>[صم])')
+
+def parse_arabic_dates(dates):
+    """Converts a Series of Arabic-formatted dates to English datetimes."""
+    parts = dates.str.extract(ARABIC_DATE_PATTERN)
+    english_month = parts['month'].map(arabic_to_english_months)
+    am_pm = parts['am_pm'].map({'ص': 'AM', 'م': 'PM'})
+    english_dates = english_month + ' ' + parts['year'] + ' ' + parts['time'] + ' ' + am_pm
+    # Rows that did not match or have an unknown month are NaN here and become NaT
+    return pd.to_datetime(english_dates, format='%B %Y %I:%M %p', errors='coerce', cache=True)
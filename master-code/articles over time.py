@@ -1,27 +1,26 @@
 import sqlite3
 import pandas as pd
 import matplotlib.pyplot as plt
-from camel_tools.tokenizers.word import simple_word_tokenize
-import nltk
 import os
 
-# Ensure NLTK stopwords are downloaded
-nltk.download('stopwords')
+# Resample rules and label formats for monthly and yearly article counts
+RESAMPLE_RULES = {'M': 'MS', 'Y': 'YS'}
+PERIOD_FORMATS = {'M': '%Y-%m', 'Y': '%Y'}
 
 def load_data_from_db(query, database_path='processed_articles.db'):
     """Loads article data from SQLite database."""
     if not os.path.isfile(database_path):
         raise FileNotFoundError(f"Database file '{database_path}' not found.")
     conn = sqlite3.connect(database_path)
-    df = pd.read_sql_query(query, conn)
+    df = pd.read_sql_query(query, conn, dtype_backend='pyarrow')
     conn.close()
     return df
 
-def load_data_from_csv(file_path):
-    """Loads article data from CSV file."""
+def load_data_from_csv(file_path, usecols=None):
+    """Loads article data from CSV file, optionally restricted to `usecols`."""
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"CSV file '{file_path}' not found.")
-    df = pd.read_csv(file_path)
+    df = pd.read_csv(file_path, usecols=usecols, engine='pyarrow', dtype_backend='pyarrow')
     return df
 
 def prepare_articles_data(df):
@@ -31,10 +30,16 @@ def prepare_articles_data(df):
     df = df[(df['published_dt'] >= '2000-01-01') & (df['published_dt'] <= '2023-12-31')]
     return df
 
+def count_articles(df, freq='M'):
+    """Counts the articles published in each month ('M') or year ('Y')."""
+    article_counts = df.set_index('published_dt').resample(RESAMPLE_RULES[freq]).size()
+    article_counts = article_counts[article_counts > 0]  # Keep only periods with articles
+    article_counts.index = article_counts.index.strftime(PERIOD_FORMATS[freq])
+    return article_counts
+
 def plot_articles_count(df, freq='M', title='Number of Articles per Month/Year'):
     """Plots the article counts."""
-    df[freq] = df['published_dt'].dt.to_period(freq)
-    article_counts = df.groupby(freq).size()
+    article_counts = count_articles(df, freq)
 
     plt.figure(figsize=(15, 7))
     article_counts.plot(kind='bar', width=0.8)
@@ -47,11 +52,9 @@ def plot_articles_count(df, freq='M', title='Number of Articles per Month/Year')
 
 def analyze_article_production(df):
     """Analyzes and plots article production over time."""
-    df['month_year'] = df['published_dt'].dt.to_period('M')
-    monthly_articles = df.groupby('month_year').size()
+    monthly_articles = count_articles(df, freq='M')
 
-    mean_articles = monthly_articles.mean()
-    std_articles = monthly_articles.std()
+    mean_articles, std_articles = monthly_articles.agg(['mean', 'std'])
     high_threshold = mean_articles + std_articles
     low_threshold = mean_articles - std_articles
 
@@ -81,11 +84,12 @@ def analyze_article_production(df):
 
 def main():
     # Specify data source (uncomment the appropriate line based on data source)
-    # query = "SELECT id, published_dt, clean_content, clean_headline FROM articles"
+    # Only the publication date is needed, so the article text is never loaded
+    # query = "SELECT published_dt FROM articles"
     # df_articles = load_data_from_db(query, 'processed_articles.db')
     
     # Using CSV file as a data source
-    df_articles = load_data_from_csv('processed_articles(tokenized,stopwords,not lemmetised).csv')
+    df_articles = load_data_from_csv('processed_articles(tokenized,stopwords,not lemmetised).csv', usecols=['published_dt'])
 
     # Prepare data
     df_articles = prepare_articles_data(df_articles)
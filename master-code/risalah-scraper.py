@@ -1,42 +1,40 @@
-#pip install requests beautifulsoup4 tenacity
+#pip install httpx[http2,brotli] aiolimiter selectolax tenacity
 
 import os
-import requests
-from bs4 import BeautifulSoup
-import time
+import asyncio
+import logging
+import httpx
+from aiolimiter import AsyncLimiter
+from selectolax.lexbor import LexborHTMLParser
 import sqlite3
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue
-from threading import Lock
-from tenacity import retry, stop_after_attempt, wait_exponential
-import random
+from queue import Queue, Empty
+from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 # Configuration parameters
 ARTICLES_PATH = 'articles'
 DATABASE_PATH = 'articles.db'
 NUM_WORKERS = 5
+IO_WORKERS = 4  # Threads writing article files off the event loop
 RATE_LIMIT = 5
+BATCH_SIZE = 500
+DB_BATCH_SIZE = 500
+DB_FLUSH_INTERVAL = 5  # Seconds to wait for more rows before writing a partial batch
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+# Keep connections alive so HTTP/2 requests share them instead of reconnecting
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+# Log with timestamps and levels so failures can be filtered from progress messages
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+logger = logging.getLogger(__name__)
 
 # Initialize the directory for storing articles
 if not os.path.exists(ARTICLES_PATH):
     os.makedirs(ARTICLES_PATH)
 
-# Set up a global queue for managing post IDs
-post_queue = Queue()
-
-# Helper class to manage rate limiting
-class RateLimiter:
-    def __init__(self, rate):
-        self.rate = rate  # Requests per second
-        self.timestamp = time.time()
-        self.lock = Lock()
-
-    def wait(self):
-        with self.lock:
-            elapsed = time.time() - self.timestamp
-            if elapsed < 1 / self.rate:
-                time.sleep((1 / self.rate) - elapsed)
-            self.timestamp = time.time()
+# Set up a global queue feeding scraped rows to the database writer
+row_queue = Queue()
 
 # Ensure the required database table exists
 def init_database():
@@ -55,108 +53,155 @@ def init_database():
     conn.commit()
     conn.close()
 
+# Directory holding the articles of a block of 10000 post IDs
+def shard_directory(post_id):
+    return os.path.join(ARTICLES_PATH, f'{post_id // 10000 * 10000}-{(post_id // 10000 + 1) * 10000 - 1}')
+
+# Blocking file write, run on the IO thread pool
+def write_file(path, payload):
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(payload.encode('utf-8'))
+
+# Single writer thread inserting queued rows in batched transactions
+def database_writer():
+    conn = sqlite3.connect(DATABASE_PATH)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+
+    def flush(batch):
+        if batch:
+            with conn:
+                conn.executemany('''
+                    INSERT OR IGNORE INTO articles (id, headline, published, category, source, content)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', batch)
+            batch.clear()
+
+    batch = []
+    while True:
+        try:
+            row = row_queue.get(timeout=DB_FLUSH_INTERVAL)
+        except Empty:
+            flush(batch)
+            continue
+        if row is None:  # Sentinel sent once scraping is finished
+            break
+        batch.append(row)
+        if len(batch) >= DB_BATCH_SIZE:
+            flush(batch)
+
+    flush(batch)
+    conn.close()
+
+# Only transient failures are worth retrying: connection problems, timeouts,
+# protocol errors, server errors and rate limiting
+def is_retryable(exception):
+    if isinstance(exception, httpx.HTTPStatusError):
+        status = exception.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exception, httpx.TransportError)
+
 # Retry mechanism for HTTP requests
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-def scrape_article(post_id, session):
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10),
+       retry=retry_if_exception(is_retryable), reraise=True)
+async def scrape_article(post_id, client, limiter, semaphore, io_pool):
     try:
         article_url = f'https://alresalah.ps/post/{post_id}'
-        response = session.get(article_url)
+        async with semaphore, limiter:
+            response = await client.get(article_url)
 
         if response.status_code == 404:
-            print(f"No content found for post ID: {post_id}")
+            logger.info("No content found for post ID: %s", post_id)
             return
 
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = LexborHTMLParser(response.content)
 
-        headline_tag = soup.find('h1', class_='page-post-title font-weight-bold')
+        headline_tag = tree.css_first('h1.page-post-title.font-weight-bold')
         if not headline_tag:
-            print(f"No headline or content found for post ID: {post_id}")
+            logger.info("No headline or content found for post ID: %s", post_id)
             return
 
-        headline = headline_tag.get_text(strip=True)
+        headline = headline_tag.text(strip=True)
 
-        time_tag = soup.find('time', class_='d-flex align-items-center')
-        time_text = time_tag.get_text(strip=True) if time_tag else 'No Date'
+        time_tag = tree.css_first('time.d-flex.align-items-center')
+        time_text = time_tag.text(strip=True) if time_tag else 'No Date'
 
         # Extract category information
         category = 'No Category'
-        breadcrumb = soup.find('ol', class_='breadcrumb p-0')
+        breadcrumb = tree.css_first('ol.breadcrumb.p-0')
         if breadcrumb:
-            category_link = breadcrumb.find_all('li')[-1].find('a')
+            category_link = breadcrumb.css('li')[-1].css_first('a')
             if category_link:
-                category = category_link.get_text(strip=True)
+                category = category_link.text(strip=True)
 
-        source_tag = soup.find('h4', class_='page-post-source font-size-22 text-danger')
-        source_text = source_tag.get_text(strip=True) if source_tag else 'No Source'
+        source_tag = tree.css_first('h4.page-post-source.font-size-22.text-danger')
+        source_text = source_tag.text(strip=True) if source_tag else 'No Source'
 
-        article_tags = soup.find_all('div', class_='p-4 bg-white')
         article_texts = []
-        for article in article_tags:
-            for p3_div in article.find_all('div', class_='p-3'):
+        for article in tree.css('div.p-4.bg-white'):
+            for p3_div in article.css('div.p-3'):
                 p3_div.decompose()
-            article_texts.append(article.get_text(separator='\n', strip=True))
+            # Whitespace-only text nodes come back as empty lines, drop them
+            article_text = article.text(separator='\n', strip=True)
+            article_texts.append('\n'.join(line for line in article_text.split('\n') if line))
 
         article_content = "\n".join(article_texts)
 
         # Save to TXT file organized into subdirectories
         if article_content.strip():
-            directory = os.path.join(ARTICLES_PATH, f'{post_id // 10000 * 10000}-{(post_id // 10000 + 1) * 10000 - 1}')
-            if not os.path.exists(directory):
-                os.makedirs(directory)
             filename = f"{post_id}_{headline[:50].replace('/', '-')}.txt"
-            filepath = os.path.join(directory, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"Title: {headline}\n")
-                f.write(f"Published: {time_text}\n")
-                f.write(f"Category: {category}\n")
-                f.write(f"Source: {source_text}\n\n")
-                f.write(article_content)
-            print(f"Saved article from post ID: {post_id}")
-
-            # Database insertion
-            conn = sqlite3.connect(DATABASE_PATH)
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO articles (id, headline, published, category, source, content)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (post_id, headline, time_text, category, source_text, article_content))
-            conn.commit()
-            conn.close()
-
-    except requests.exceptions.RequestException as e:
-        print(f"Error in scraping article {post_id}: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response content: {e.response.content}")
-            print(f"Response headers: {e.response.headers}")
+            filepath = os.path.join(shard_directory(post_id), filename)
+            payload = (f"Title: {headline}\n"
+                       f"Published: {time_text}\n"
+                       f"Category: {category}\n"
+                       f"Source: {source_text}\n\n"
+                       f"{article_content}")
+            await asyncio.get_running_loop().run_in_executor(io_pool, write_file, filepath, payload)
+            logger.info("Saved article from post ID: %s", post_id)
+
+            # Hand the row over to the database writer
+            row_queue.put((post_id, headline, time_text, category, source_text, article_content))
+
+    except httpx.HTTPError as e:
+        logger.warning("Error in scraping article %s: %s (status=%s)", post_id, e,
+                       e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None)
         raise
 
-# Worker function for thread execution
-def worker(session, rate_limiter):
-    while not post_queue.empty():
-        post_id = post_queue.get()
-        rate_limiter.wait()
-        scrape_article(post_id, session)
-        post_queue.task_done()
-        time.sleep(random.uniform(1, 3))
-
 # Main function to initiate article scraping
-def scrape_all_articles(start_id, end_id):
-    rate_limiter = RateLimiter(RATE_LIMIT)
+async def scrape_all_articles(start_id, end_id):
+    # Concurrency is bounded by the semaphore, request rate by the shared limiter
+    limiter = AsyncLimiter(RATE_LIMIT, 1)
+    semaphore = asyncio.Semaphore(NUM_WORKERS)
+
+    # Create every shard directory up front instead of checking on each article
+    for shard_start in range(start_id // 10000 * 10000, end_id + 1, 10000):
+        os.makedirs(shard_directory(shard_start), exist_ok=True)
 
-    for post_id in range(start_id, end_id + 1):
-        post_queue.put(post_id)
+    writer = Thread(target=database_writer)
+    writer.start()
 
-    with requests.Session() as session:
-        session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
-        with ThreadPoolExecutor(max_workers=NUM_WORKERS) as executor:
-            futures = [executor.submit(worker, session, rate_limiter) for _ in range(NUM_WORKERS)]
-            for future in as_completed(futures):
-                future.result()
+    try:
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as io_pool:
+            async with httpx.AsyncClient(http2=True, headers=HEADERS, limits=HTTP_LIMITS) as client:
+                for batch_start in range(start_id, end_id + 1, BATCH_SIZE):
+                    batch_end = min(batch_start + BATCH_SIZE, end_id + 1)
+                    results = await asyncio.gather(
+                        *(scrape_article(post_id, client, limiter, semaphore, io_pool)
+                          for post_id in range(batch_start, batch_end)),
+                        return_exceptions=True
+                    )
+                    for post_id, result in zip(range(batch_start, batch_end), results):
+                        if isinstance(result, Exception):
+                            logger.error("Giving up on post ID %s: %r", post_id, result)
+    finally:
+        row_queue.put(None)
+        writer.join()
 
 # Initialize the database before starting to scrape
 init_database()
 
 # Start scraping articles with the specified range and settings
-scrape_all_articles(273293, 301000)
+asyncio.run(scrape_all_articles(273293, 301000))
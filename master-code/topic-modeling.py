@@ -1,95 +1,88 @@
+import os
 import sqlite3
 import pandas as pd
+from pandarallel import pandarallel
 import re
-import nltk
-from nltk.corpus import stopwords
-from gensim import corpora, models
+from arabic_stopwords import STOPWORDS
+from arabic_dates import parse_arabic_dates
+import numpy as np
+from gensim import corpora, matutils
+from sklearn.decomposition import LatentDirichletAllocation
 import matplotlib.pyplot as plt
-import seaborn as sns
 
-# Ensure NLTK stopwords are downloaded
-nltk.download('stopwords')
+# Precompiled cleaning patterns, built once per process
+STRIP_PATTERN = re.compile(r'[\u064B-\u0652]|[^\w\s]|\d+')
 
-def load_data(database_path='articles.db'):
-    """Connects to SQLite database and loads article data."""
+# Number of articles loaded and processed at a time
+CHUNK_SIZE = 2000
+
+# Dictionary and bag-of-words corpus persisted to disk for LDA training and
+# reused by later runs; delete both files to rebuild them from the database
+DICTIONARY_PATH = 'corpus.dict'
+CORPUS_PATH = 'corpus.mm'
+
+def load_data(database_path='articles.db', chunksize=CHUNK_SIZE):
+    """Connects to SQLite database and yields article data in chunks."""
     if not os.path.isfile(database_path):
         raise FileNotFoundError(f"Database file '{database_path}' not found.")
     conn = sqlite3.connect(database_path)
-    df = pd.read_sql_query("SELECT headline, published, category, content FROM articles", conn)
-    conn.close()
-    return df
+    try:
+        yield from pd.read_sql_query("SELECT id, published, content FROM articles", conn, chunksize=chunksize,
+                                     dtype_backend='pyarrow')
+    finally:
+        conn.close()
 
-# Arabic month to English mapping
-arabic_to_english_months = {
-    'يناير': 'January', 'فبراير': 'February', 'مارس': 'March',
-    'أبريل': 'April', 'مايو': 'May', 'يونيو': 'June',
-    'يوليو': 'July', 'أغسطس': 'August', 'سبتمبر': 'September',
-    'أكتوبر': 'October', 'نوفمبر': 'November', 'ديسمبر': 'December'
-}
+def clean_and_tokenize(text):
+    """Cleans Arabic text and returns its tokens without stop words."""
+    # Stripping diacritics, punctuation and digits, splitting on whitespace and
+    # filtering stop words in one go avoids building intermediate strings
+    return [word for word in STRIP_PATTERN.sub('', text).split() if word not in STOPWORDS]
 
-def parse_arabic_date(date_str):
-    """Converts Arabic date format to Python datetime."""
-    date_pattern = re.compile(r'(\w+)\s+(\d{4})\s\.\sالساعة:\s(\d{2}:\d{2}\s[صم])')
-    match = date_pattern.search(date_str)
-    if not match:
-        return None
-    
-    arabic_month = match.group(1)
-    year = match.group(2)
-    time = match.group(3).replace('م', 'PM').replace('ص', 'AM')
-    english_month = arabic_to_english_months.get(arabic_month)
-    
-    if not english_month:
-        return None
-    
-    english_date_str = f'{english_month} {year} {time}'
-    try:
-        return pd.to_datetime(english_date_str, format='%B %Y %I:%M %p', errors='coerce')
-    except Exception as e:
-        print(f"Error parsing date: {e}")
-        return None
+def iter_texts(database_path='articles.db'):
+    """Streams the tokens of every dated article from the database."""
+    for df in load_data(database_path):
+        df['published'] = parse_arabic_dates(df['published'])
+        df.dropna(subset=['published'], inplace=True)
+        if not df.empty:
+            yield from df['content'].parallel_apply(clean_and_tokenize)
 
-def clean_arabic_text(text):
-    """Removes diacritics, punctuation, digits, and excess whitespace."""
-    text = re.sub(r'[\u064B-\u0652]', '', text)  # Remove diacritics
-    text = re.sub(r'[^\w\s]', '', text)  # Remove punctuation
-    text = re.sub(r'\d+', '', text)  # Remove digits
-    text = re.sub(r'\s+', ' ', text).strip()  # Normalize whitespace
-    return text
+def perform_topic_modeling(texts_iter):
+    """Performs topic modeling using LDA on texts streamed from `texts_iter()`."""
+    if os.path.isfile(DICTIONARY_PATH) and os.path.isfile(CORPUS_PATH):
+        # Reuse the dictionary and corpus of an earlier run, skipping both database passes
+        dictionary = corpora.Dictionary.load(DICTIONARY_PATH)
+    else:
+        dictionary = corpora.Dictionary(texts_iter())
+        dictionary.filter_extremes(no_below=5, no_above=0.5)
+        # Serialize the corpus to disk instead of keeping every document in memory
+        corpora.MmCorpus.serialize(CORPUS_PATH, (dictionary.doc2bow(text) for text in texts_iter()))
+        # Saved last, so an interrupted run never leaves a dictionary without its corpus
+        dictionary.save(DICTIONARY_PATH)
+    corpus = corpora.MmCorpus(CORPUS_PATH)
 
-def remove_stopwords(text):
-    """Removes Arabic stop words."""
-    stop_words = set(stopwords.words('arabic'))
-    words = text.split()
-    return ' '.join(word for word in words if word not in stop_words)
+    # Documents x terms sparse count matrix for scikit-learn
+    doc_term_matrix = matutils.corpus2csc(corpus, num_terms=len(dictionary)).T.tocsr()
+    lda_model = LatentDirichletAllocation(n_components=5, max_iter=15, learning_method='online',
+                                          batch_size=2048, n_jobs=-1)
+    lda_model.fit(doc_term_matrix)
 
-def perform_topic_modeling(texts):
-    """Performs topic modeling using LDA."""
-    dictionary = corpora.Dictionary(texts)
-    corpus = [dictionary.doc2bow(text) for text in texts]
-    lda_model = models.LdaModel(corpus, num_topics=5, id2word=dictionary, passes=15)
-    for idx, topic in lda_model.print_topics():
+    # Print the top words of each topic in the same format as gensim's print_topics
+    for idx, weights in enumerate(lda_model.components_):
+        weights = weights / weights.sum()
+        topic = ' + '.join(f'{weights[i]:.3f}*"{dictionary[i]}"' for i in np.argsort(weights)[::-1][:10])
         print(f"Topic {idx}: {topic}")
+    return corpus
 
 def main():
-    # Load data from database
-    df = load_data()
-
-    # Apply date parsing
-    df['published'] = df['published'].apply(parse_arabic_date)
-    df.dropna(subset=['published'], inplace=True)
-
-    # Clean and preprocess text
-    df['content'] = df['content'].apply(clean_arabic_text)
-    df['content'] = df['content'].apply(remove_stopwords)
+    # Spread the per-article text cleaning across all cores
+    pandarallel.initialize(nb_workers=os.cpu_count(), progress_bar=False)
 
-    # Tokenize text for topic modeling
-    texts = [content.split() for content in df['content']]
-    perform_topic_modeling(texts)
+    # Stream cleaned articles from the database for topic modeling
+    corpus = perform_topic_modeling(iter_texts)
 
     # Dummy sentiment analysis plot
-    df['sentiment'] = df['content'].apply(lambda x: 0) # Placeholder, replace with a real sentiment analysis
-    sns.histplot(df['sentiment'], kde=True)
+    sentiments = [0] * len(corpus) # Placeholder, replace with a real sentiment analysis
+    plt.hist(sentiments)
     plt.title('Sentiment Distribution of Articles')
     plt.show()
 